@@ -2,8 +2,11 @@ import requests
 import logging
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
 
 # Import the existing models
@@ -16,6 +19,29 @@ try:
 except ImportError:
     pass  # dotenv not installed, skip
 
+# (connect, read) timeout for every API request, so a hung endpoint cannot stall the dashboard
+REQUEST_TIMEOUT = (3.05, 27)
+
+# Retry transient errors and rate limits on GETs with backoff; once retries run out the last
+# response is returned so callers still log its status code
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods={"GET"},
+    raise_on_status=False
+)
+
+# Column order of the processed rows, used when building DataFrames directly from the row iterators
+INBOUND_COLUMNS = [
+    "Consignee", "PO Number", "Delivery Est", "Last Update", "Carrier Name",
+    "Tracking", "Price", "Weight", "Cost per lb", "Status"
+]
+OUTBOUND_COLUMNS = [
+    "Consignor", "Inv Number", "Delivery Est", "Last Update", "Carrier Name",
+    "Tracking", "Email", "Price", "Weight", "Cost per lb", "Status"
+]
+
 class FreightDataService:
     """Service class for handling FreightView API interactions and data processing."""
     
@@ -25,6 +51,10 @@ class FreightDataService:
         self.base_url = "https://api.freightview.com/v2.0"
         self.logger = logging.getLogger(__name__)
         
+        # One pooled session so the token request and the shipments request share a keep-alive connection
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=RETRY_POLICY))
+        
     def get_auth_headers(self) -> Optional[Dict[str, str]]:
         """Get authentication headers for API requests."""
         token_url = f"{self.base_url}/auth/token"
@@ -36,7 +66,7 @@ class FreightDataService:
         }
         
         try:
-            response = requests.post(token_url, json=payload)
+            response = self.session.post(token_url, json=payload, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
                 token_data = response.json()
                 access_token = token_data.get("access_token")
@@ -58,10 +88,10 @@ class FreightDataService:
         url = f"{_self.base_url}/shipments?status={status}"
         
         try:
-            response = requests.get(url, headers=headers)
+            response = _self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
-                return Model.model_validate(data)
+                # Parse and validate the body in one pass instead of building dicts first
+                return Model.model_validate_json(response.content)
             else:
                 _self.logger.error(f"API request failed: {response.status_code}")
                 return None
@@ -74,10 +104,12 @@ class FreightDataService:
     
     def process_inbound_data(self, model: Model) -> List[Dict]:
         """Process inbound shipment data for dashboard display."""
-        table_data = []
-        
+        return list(self.iter_inbound_data(model))
+    
+    def iter_inbound_data(self, model: Model) -> Iterator[Dict]:
+        """Yield processed inbound shipment rows without building an intermediate list."""
         if not model or not model.shipments:
-            return table_data
+            return
             
         for shipment in model.shipments:
             if shipment.direction == "inbound":
@@ -120,7 +152,7 @@ class FreightDataService:
                     except (AttributeError, ZeroDivisionError):
                         pass
                     
-                    table_data.append({
+                    row = {
                         "Consignee": consignee,
                         "PO Number": po_number,
                         "Delivery Est": delivery_est,
@@ -131,20 +163,22 @@ class FreightDataService:
                         "Weight": weight,
                         "Cost per lb": cost_per_lb,
                         "Status": shipment.status
-                    })
+                    }
                     
                 except Exception as e:
                     self.logger.error(f"Error processing inbound shipment {shipment.shipmentId}: {str(e)}")
                     continue
-                    
-        return table_data
+                
+                yield row
     
     def process_outbound_data(self, model: Model) -> List[Dict]:
         """Process outbound shipment data for dashboard display."""
-        table_data = []
-        
+        return list(self.iter_outbound_data(model))
+    
+    def iter_outbound_data(self, model: Model) -> Iterator[Dict]:
+        """Yield processed outbound shipment rows without building an intermediate list."""
         if not model or not model.shipments:
-            return table_data
+            return
             
         for shipment in model.shipments:
             if shipment.direction == "outbound":
@@ -194,7 +228,7 @@ class FreightDataService:
                     except (AttributeError, ZeroDivisionError):
                         pass
                     
-                    table_data.append({
+                    row = {
                         "Consignor": consignor,
                         "Inv Number": inv_number,
                         "Delivery Est": delivery_est,
@@ -206,35 +240,39 @@ class FreightDataService:
                         "Weight": weight,
                         "Cost per lb": cost_per_lb,
                         "Status": shipment.status
-                    })
+                    }
                     
                 except Exception as e:
                     self.logger.error(f"Error processing outbound shipment {shipment.shipmentId}: {str(e)}")
                     continue
-                    
-        return table_data
+                
+                yield row
     
     def get_summary_metrics(self, inbound_data: List[Dict], outbound_data: List[Dict]) -> Dict:
         """Calculate summary metrics for the dashboard."""
         total_shipments = len(inbound_data) + len(outbound_data)
         
-        # Calculate average cost per lb
-        costs_per_lb = []
+        # Accumulate every metric in a single pass over both directions
+        cost_per_lb_total = 0
+        cost_per_lb_count = 0
         total_cost = 0
         total_weight = 0
+        # Count delivered shipments (this would need more status analysis in real implementation)
+        delivered_count = 0
         
-        for data in inbound_data + outbound_data:
+        for data in chain(inbound_data, outbound_data):
             if data.get("Cost per lb") is not None:
-                costs_per_lb.append(data["Cost per lb"])
+                cost_per_lb_total += data["Cost per lb"]
+                cost_per_lb_count += 1
             if data.get("Price") is not None:
                 total_cost += data["Price"]
             if data.get("Weight") is not None:
                 total_weight += data["Weight"]
+            if data.get("Status") == "delivered":
+                delivered_count += 1
         
-        avg_cost_per_lb = sum(costs_per_lb) / len(costs_per_lb) if costs_per_lb else 0
+        avg_cost_per_lb = cost_per_lb_total / cost_per_lb_count if cost_per_lb_count else 0
         
-        # Count delivered shipments (this would need more status analysis in real implementation)
-        delivered_count = sum(1 for data in inbound_data + outbound_data if data.get("Status") == "delivered")
         delivery_rate = (delivered_count / total_shipments * 100) if total_shipments > 0 else 0
         
         return {
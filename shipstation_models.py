@@ -131,4 +131,58 @@ class ShipStationShipmentsResponse(BaseModel):
     shipments: List[ShipStationShipment] = []
     total: Optional[int] = None
     page: Optional[int] = None
-    pages: Optional[int] = None
\ No newline at end of file
+    pages: Optional[int] = None
+
+# Lean models for the order and shipment listings the dashboard fetches. Only the fields it
+# reads are declared, so every other key in a multi-MB listing is skipped while parsing
+# instead of being validated and built into objects.
+class ShipStationListingAddress(BaseModel):
+    name: Optional[str] = None
+    company: Optional[str] = None
+    city: Optional[str] = None
+
+class ShipStationListingItem(BaseModel):
+    quantity: Optional[int] = None
+
+class ShipStationListingAdvancedOptions(BaseModel):
+    storeId: Optional[int] = None
+
+class ShipStationOrderListing(BaseModel):
+    orderId: Optional[int] = None
+    orderNumber: Optional[str] = None
+    orderDate: Optional[str] = None
+    orderStatus: Optional[str] = None
+    customerEmail: Optional[str] = None
+    shipTo: Optional[ShipStationListingAddress] = None
+    items: List[ShipStationListingItem] = []
+    orderTotal: Optional[float] = None
+    requestedShippingService: Optional[str] = None
+    carrierCode: Optional[str] = None
+    shipDate: Optional[str] = None
+    weight: Optional[ShipStationWeight] = None
+    advancedOptions: Optional[ShipStationListingAdvancedOptions] = None
+
+class ShipStationOrdersListingResponse(BaseModel):
+    orders: List[ShipStationOrderListing] = []
+    total: Optional[int] = None
+    page: Optional[int] = None
+    pages: Optional[int] = None
+
+class ShipStationShipmentListing(BaseModel):
+    shipmentId: Optional[int] = None
+    orderNumber: Optional[str] = None
+    customerEmail: Optional[str] = None
+    shipDate: Optional[str] = None
+    shipmentCost: Optional[float] = None
+    trackingNumber: Optional[str] = None
+    carrierCode: Optional[str] = None
+    serviceCode: Optional[str] = None
+    voided: Optional[bool] = None
+    shipTo: Optional[ShipStationListingAddress] = None
+    weight: Optional[ShipStationWeight] = None
+
+class ShipStationShipmentsListingResponse(BaseModel):
+    shipments: List[ShipStationShipmentListing] = []
+    total: Optional[int] = None
+    page: Optional[int] = None
+    pages: Optional[int] = None
@@ -11,6 +11,10 @@ import json
 # Import the modules to test
 from data_service import FreightDataService
 from freightviewslack.pydatamodel import Model
+from shipstation_models import ShipStationOrdersListingResponse
+from unified_data_service import (
+    ORDER_COLUMNS, UnifiedDataService, _fmt_date, _format_weights, build_store_map
+)
 from test_data import get_mock_api_responses
 
 class TestFreightDataService:
@@ -203,6 +207,134 @@ class TestFreightDataService:
         assert metrics["avg_cost_per_lb"] == 0
         assert metrics["total_cost"] == 0
 
+
+class TestShipStationProcessing:
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.service = UnifiedDataService("fv_id", "fv_secret", "ss_key", "ss_secret")
+        self.stores = [
+            {"storeId": 101, "storeName": "Shopify Store"},
+            {"storeId": 102, "storeName": "Wholesale Direct"}
+        ]
+        self.orders = ShipStationOrdersListingResponse.model_validate({
+            "orders": [
+                {
+                    "orderId": 1,
+                    "orderNumber": "1001",
+                    "orderDate": "2025-08-05T10:15:00.0000000",
+                    "orderStatus": "awaiting_shipment",
+                    "customerEmail": "buyer@example.com",
+                    "shipTo": {"name": "Jane Doe", "company": "Acme", "city": "Austin"},
+                    "items": [{"quantity": 2}, {"quantity": 3}],
+                    "orderTotal": 120.5,
+                    "weight": {"value": 2, "units": "pounds"},
+                    "advancedOptions": {"storeId": 101}
+                },
+                {
+                    "orderId": 2,
+                    "orderNumber": "1002",
+                    "orderDate": "2025-08-06T08:00:00.0000000",
+                    "orderStatus": "awaiting_shipment",
+                    "shipTo": {"name": "John Roe", "city": "Denver"},
+                    "items": [{"quantity": 1}],
+                    "orderTotal": 30.0,
+                    "weight": {"value": 8, "units": "ounces"},
+                    "advancedOptions": {"storeId": 999}
+                },
+                {
+                    "orderId": 3,
+                    "orderNumber": "1003",
+                    "orderStatus": "awaiting_shipment"
+                }
+            ]
+        })
+    
+    def test_format_weights_lbs_oz_boundary(self):
+        """Test that pound and ounce weights switch to lbs at 16 oz."""
+        display = _format_weights((16.0, 15.9, 1.0, 0.99), ("ounces", "ounces", "pounds", "pounds"))
+        
+        assert display == ["1.0 lbs", "15.9 oz", "1.0 lbs", "15.8 oz"]
+    
+    def test_format_weights_unknown_unit_and_missing(self):
+        """Test that unknown units pass through and missing weights show N/A."""
+        display = _format_weights((5.0, None, 2.0), ("grams", None, "LBS"))
+        
+        assert display == ["5.0 grams", "N/A", "2.0 lbs"]
+        assert _format_weights((), ()) == []
+    
+    def test_fmt_date(self):
+        """Test M/D/YYYY date formatting."""
+        assert _fmt_date("2025-08-05T10:15:00.0000000") == "8/5/2025"
+        assert _fmt_date("2025-12-31") == "12/31/2025"
+        assert _fmt_date(None) is None
+        # Malformed dates are returned unchanged
+        assert _fmt_date("08/05/2025") == "08/05/2025"
+        assert _fmt_date("2025-ab-05") == "2025-ab-05"
+        assert _fmt_date("2025-08") == "2025-08"
+    
+    def test_build_store_map_skips_malformed_records(self):
+        """Test that malformed or incomplete store records are skipped."""
+        stores = self.stores + [{"storeName": "No ID"}, {"storeId": 103, "storeName": ""}, None, "bad"]
+        
+        assert build_store_map(stores) == {"101": "Shopify Store", "102": "Wholesale Direct"}
+        assert build_store_map(None) == {}
+    
+    def test_non_string_store_name(self):
+        """Test that non-string store names from the raw payload are stored as strings."""
+        store_id_to_name = build_store_map([{"storeId": 104, "storeName": 2024}])
+        orders = ShipStationOrdersListingResponse.model_validate({
+            "orders": [{"orderId": 4, "orderNumber": "1004", "advancedOptions": {"storeId": 104}}]
+        })
+        
+        assert store_id_to_name == {"104": "2024"}
+        assert self.service.process_shipstation_orders(orders, [{"storeId": 104, "storeName": 2024}])["Store"] == ["2024"]
+    
+    def test_process_shipstation_orders(self):
+        """Test processing ShipStation orders into display columns."""
+        columns = self.service.process_shipstation_orders(self.orders, self.stores)
+        
+        assert list(columns) == ORDER_COLUMNS
+        assert columns["Order ID"] == ["1001", "1002", "1003"]
+        assert columns["Store"] == ["Shopify", "Store 999", "Unknown Store"]
+        assert columns["Customer"] == ["buyer@example.com", "N/A", "N/A"]
+        assert columns["Ship To"] == ["Acme (Austin)", "John Roe (Denver)", " ()"]
+        assert columns["Items"] == [5, 1, 0]
+        assert columns["Order Total"] == [120.5, 30.0, 0]
+        assert columns["Weight"] == ["2.0 lbs", "8.0 oz", "N/A"]
+        assert columns["Order Date"] == ["8/5/2025", "8/6/2025", None]
+        assert columns["Ship Date"] == ["Not Shipped"] * 3
+        assert columns["Carrier"] == ["Not Assigned"] * 3
+        assert columns["_order_date_raw"][0] == "2025-08-05T10:15:00.0000000"
+    
+    def test_process_shipstation_orders_empty(self):
+        """Test that empty order responses give empty columns."""
+        columns = self.service.process_shipstation_orders(ShipStationOrdersListingResponse(orders=[]), self.stores)
+        
+        assert list(columns) == ORDER_COLUMNS
+        assert all(values == [] for values in columns.values())
+        assert self.service.process_shipstation_orders(None) == columns
+    
+    def test_shipstation_summary_totals(self):
+        """Test that totals from the processed columns match the raw-response summary."""
+        all_data = {
+            "freightview": {"shipments": None, "error": None},
+            "shipstation": {"orders": self.orders, "shipments": None, "stores": self.stores, "error": None},
+            "airtable": {"upcoming_pickups": None, "error": None}
+        }
+        columns = self.service.process_shipstation_orders(self.orders, self.stores)
+        order_totals = self.service.get_order_totals(columns)
+        
+        summary = self.service.get_unified_summary(all_data)["shipstation"]
+        
+        assert order_totals == {"pending_orders": 3, "total_order_value": 150.5}
+        assert summary["pending_orders"] == 3
+        assert summary["total_order_value"] == 150.5
+        assert self.service.get_unified_summary(all_data, order_totals)["shipstation"] == summary
+        
+        empty_columns = self.service.process_shipstation_orders(ShipStationOrdersListingResponse(orders=[]))
+        assert self.service.get_order_totals(empty_columns) == {"pending_orders": 0, "total_order_value": 0}
+
 def run_tests():
     """Run all tests manually without pytest."""
     test_instance = TestFreightDataService()
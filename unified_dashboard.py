@@ -1,13 +1,26 @@
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import time
 import os
-from typing import Optional
+import hashlib
+import io
+import json
+from collections import Counter
+from typing import TYPE_CHECKING, Optional
+
+from data_service import INBOUND_COLUMNS, OUTBOUND_COLUMNS
+from unified_data_service import UnifiedDataService, timed
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _pd():
+    """Import pandas on first use so the landing screen renders without it."""
+    import pandas as pd
+    return pd
 
-from unified_data_service import UnifiedDataService
 
 # Page configuration
 st.set_page_config(
@@ -18,7 +31,7 @@ st.set_page_config(
 )
 
 # Custom CSS with sage + ming + indigo dye color scheme
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -105,6 +118,13 @@ st.markdown("""
         border-bottom: 2px solid #28666e;
     }
     
+    .store-grid {
+        display: grid;
+        grid-template-columns: repeat(3, minmax(0, 1fr));
+        gap: 0.75rem 1rem;
+        margin-top: 1.5rem;
+    }
+    
     .store-metric-card {
         background: linear-gradient(to bottom right, #f5f7f3, #e8ede5);
         border: 1.5px solid #7c9885;
@@ -137,7 +157,13 @@ st.markdown("""
         font-weight: 700;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _inject_css() -> bool:
+    """Send the custom CSS; cached so reruns replay it instead of rebuilding the element."""
+    st.markdown(_CSS, unsafe_allow_html=True)
+    return True
 
 def get_config():
     """Get configuration from environment."""
@@ -180,6 +206,163 @@ def get_config():
         st.error(f"Configuration error: {str(e)}")
         st.stop()
 
+@st.cache_resource
+def get_unified_service(fv_client_id: str, fv_client_secret: str, ss_api_key: str, ss_api_secret: str,
+                        at_api_key: Optional[str] = None, at_base_id: Optional[str] = None,
+                        at_table_name: Optional[str] = None) -> UnifiedDataService:
+    """Create the unified service once per set of credentials and share it across reruns."""
+    return UnifiedDataService(
+        fv_client_id, fv_client_secret,
+        ss_api_key, ss_api_secret,
+        at_api_key, at_base_id, at_table_name
+    )
+
+def _payload_digest(payload) -> str:
+    """Fingerprint a raw API payload so unchanged responses map to the same cached tables."""
+    if hasattr(payload, "model_dump_json"):
+        data = payload.model_dump_json().encode()
+    else:
+        data = json.dumps(payload, default=str, sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@st.cache_resource(ttl=900, show_spinner=False)  # Cache for 15 minutes
+def load_all(fv_client_id: str, fv_client_secret: str, ss_api_key: str, ss_api_secret: str,
+             at_api_key: Optional[str] = None, at_base_id: Optional[str] = None,
+             at_table_name: Optional[str] = None, refresh_token: int = 0) -> tuple:
+    """Fetch all services and build the unified summary.
+    
+    Returns (all_data, summary, fetch timings, load time, payload digests, processed rows).
+    Processed rows are keyed like the tables (fv_in, fv_out, ss_ord). FreightView shipments and
+    ShipStation orders are processed once here for both the summary and the tables.
+    A new refresh_token also bypasses the cached ShipStation responses.
+    Cached as a resource so reruns share the already-validated models instead of
+    unpickling a fresh copy of every order and shipment; callers must treat it as read-only.
+    """
+    unified_service = get_unified_service(
+        fv_client_id, fv_client_secret,
+        ss_api_key, ss_api_secret,
+        at_api_key, at_base_id, at_table_name
+    )
+    all_data, timings = unified_service.fetch_all_data(refresh_token)
+    
+    processed = {}
+    fv_shipments = all_data["freightview"]["shipments"]
+    if fv_shipments:
+        with timed(timings, "FreightView processing"):
+            processed["fv_in"] = unified_service.freight_service.process_inbound_data(fv_shipments)
+            processed["fv_out"] = unified_service.freight_service.process_outbound_data(fv_shipments)
+    
+    order_totals = None
+    if all_data["shipstation"]["orders"]:
+        with timed(timings, "ShipStation orders processing"):
+            processed["ss_ord"] = unified_service.process_shipstation_orders(
+                all_data["shipstation"]["orders"], all_data["shipstation"]["stores"]
+            )
+        # The summary totals come from the processed columns instead of another pass over the orders
+        order_totals = unified_service.get_order_totals(processed["ss_ord"])
+    
+    with timed(timings, "Unified summary"):
+        summary = unified_service.get_unified_summary(
+            all_data, order_totals, processed.get("fv_in"), processed.get("fv_out")
+        )
+    with timed(timings, "Payload digests"):
+        digests = {
+            "freightview": _payload_digest(all_data["freightview"]["shipments"]),
+            "ss_orders": _payload_digest(all_data["shipstation"]["orders"]),
+            "ss_stores": _payload_digest(all_data["shipstation"]["stores"]),
+            "ss_shipments": _payload_digest(all_data["shipstation"]["shipments"]),
+            "airtable": _payload_digest(all_data.get("airtable", {}).get("upcoming_pickups")),
+        }
+    return all_data, summary, timings, datetime.now(), digests, processed
+
+@st.fragment(run_every="60s")
+def summary_panel(credentials: tuple):
+    """Render the control panel and the service status columns.
+    
+    Runs as a fragment, so the once-a-minute auto-refresh only re-renders this panel.
+    The whole app reruns only when the cached load has produced new data.
+    """
+    if st.session_state.auto_refresh_enabled and st.session_state.data_loaded:
+        # Served from cache until the 15-minute TTL expires
+        try:
+            loaded_at = load_all(*credentials, refresh_token=st.session_state.refresh_token)[3]
+        except Exception as e:
+            # Same handling as main(); rerun the app so it drops the stale tables
+            st.session_state.update({
+                "error_message": f"Error loading data: {str(e)}",
+                "data_loaded": False
+            })
+            st.rerun(scope="app")
+        if loaded_at != st.session_state.last_update:
+            st.rerun(scope="app")
+    
+    # Control panel
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        if st.session_state.last_update:
+            next_update = st.session_state.last_update + timedelta(minutes=15)
+            time_until_next = next_update - datetime.now()
+            if time_until_next.total_seconds() > 0:
+                minutes_left = int(time_until_next.total_seconds() / 60)
+                st.markdown(f"""
+                <div class="refresh-info">
+                    ⏰ Next auto-refresh in: {minutes_left} minutes | 
+                    Last updated: {st.session_state.last_update.strftime('%Y-%m-%d %H:%M:%S')}
+                </div>
+                """, unsafe_allow_html=True)
+    
+    with col2:
+        if st.button("🔄 Refresh All Data", type="primary"):
+            # Drop the cached load and move to a new token so the cached API responses are skipped too
+            load_all.clear()
+            st.session_state.refresh_token += 1
+            st.rerun()
+    
+    with col3:
+        auto_refresh = st.toggle("🔄 Auto-refresh", value=st.session_state.auto_refresh_enabled)
+        st.session_state.auto_refresh_enabled = auto_refresh
+    
+    # Display service status in three clean columns
+    if st.session_state.data_loaded:
+        all_data = st.session_state.all_data
+        summary = st.session_state.summary
+        
+        # Create three-column layout
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            create_freight_view_column(all_data, summary)
+        
+        with col2:
+            create_shipstation_column(st.session_state.processed.get("ss_ord"), summary)
+        
+        with col3:
+            if "airtable" in summary:
+                create_upcoming_pickups_column(all_data, summary)
+            else:
+                # Show placeholder if Airtable not configured
+                st.markdown("""
+                <div style="
+                    background: linear-gradient(to bottom right, #f5f7f3, #e8ede5);
+                    border: 1.5px solid #7c9885;
+                    border-left: 4px solid #7c9885;
+                    border-radius: 12px;
+                    padding: 1.2rem;
+                    height: 100%;
+                    box-shadow: 0 2px 8px rgba(124, 152, 133, 0.12);
+                ">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem; padding-bottom: 0.5rem; border-bottom: 2px solid #7c9885;">
+                        <span style="font-size: 1.5rem; margin-right: 0.5rem;">📅</span>
+                        <span style="font-size: 1.1rem; font-weight: 600; color: #033f63;">Upcoming Pickups</span>
+                        <span style="margin-left: auto; font-size: 0.9rem;">⚠️</span>
+                    </div>
+                    <div style="color: #28666e; font-size: 0.9rem; opacity: 0.7; text-align: center; margin-top: 1rem;">
+                        Airtable not configured
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
 def initialize_session_state():
     """Initialize session state variables."""
     if 'last_update' not in st.session_state:
@@ -190,6 +373,14 @@ def initialize_session_state():
         st.session_state.error_message = None
     if 'auto_refresh_enabled' not in st.session_state:
         st.session_state.auto_refresh_enabled = True
+    if 'timings' not in st.session_state:
+        st.session_state.timings = {}
+    if 'refresh_token' not in st.session_state:
+        st.session_state.refresh_token = 0
+    if 'dfs' not in st.session_state:
+        st.session_state.dfs = {}
+    if 'dfs_loaded_at' not in st.session_state:
+        st.session_state.dfs_loaded_at = None
 
 def create_freight_view_column(data: dict, summary: dict):
     """Create FreightView information column."""
@@ -229,67 +420,20 @@ def create_freight_view_column(data: dict, summary: dict):
     </div>
     """, unsafe_allow_html=True)
 
-def create_shipstation_column(data: dict, summary: dict):
-    """Create ShipStation information column with store breakdown."""
+def create_shipstation_column(order_columns: Optional[dict], summary: dict):
+    """Create ShipStation information column with store breakdown.
+    
+    order_columns are the processed ShipStation order columns from load_all, so the
+    breakdown uses the same store names as the orders table.
+    """
     status = summary["shipstation"]["status"]
     status_icon = "✅" if status == "connected" else "⚠️"
     
     # Get order counts
     pending_orders = summary["shipstation"].get("pending_orders", 0)
     
-    # Store name abbreviation dictionary
-    STORE_ABBREVIATIONS = {
-        'Bala': 'Bala',
-        'Body Nutrition - Wholesale': 'Wholesale',
-        'Gym Molly Store': 'Gym Molly',
-        'MWL Buyside Store': 'MWL',
-        'Manual Orders': 'Manual',
-        'MediWeight OLD Orders': 'MWL OLD',
-        'New Amazon Store': 'Amazon',
-        'Rate Browser': 'Unused',
-        'Shopify Store': 'Shopify',
-        'TestRateShopping': 'TEST'
-    }
-    
-    # Build store ID to name mapping from stores API
-    store_id_to_name = {}
-    if data["shipstation"].get("stores"):
-        for store in data["shipstation"]["stores"]:
-            if isinstance(store, dict):
-                store_id = store.get('storeId')
-                store_name = store.get('storeName')
-                if store_id and store_name:
-                    store_id_to_name[str(store_id)] = store_name
-    
-    # Extract store breakdown
-    store_breakdown = {}
-    
-    if data["shipstation"]["orders"] and data["shipstation"]["orders"].orders:
-        for order in data["shipstation"]["orders"].orders:
-            store_id = None
-            
-            # Check advancedOptions for store ID
-            if order.advancedOptions:
-                store_id = order.advancedOptions.get('storeId')
-            
-            # Get the store name from our mapping
-            if store_id and str(store_id) in store_id_to_name:
-                store_key = store_id_to_name[str(store_id)]
-            elif store_id:
-                store_key = f"Store {store_id}"
-            else:
-                store_key = "Unknown Store"
-            
-            # Clean up the store name and ensure it's a string
-            store_key = str(store_key).strip()
-            
-            # Apply abbreviation with fallback to original name
-            store_key = STORE_ABBREVIATIONS.get(store_key, store_key)
-            
-            store_breakdown[store_key] = store_breakdown.get(store_key, 0) + 1
-    
-    # Sort stores by order count
-    sorted_stores = sorted(store_breakdown.items(), key=lambda x: x[1], reverse=True)
+    # Store breakdown, sorted by order count
+    sorted_stores = Counter(order_columns["Store"]).most_common() if order_columns else []
     
     # Create the main container with header and metric inside
     st.markdown(f"""
@@ -308,42 +452,32 @@ def create_shipstation_column(data: dict, summary: dict):
     </div>
     """, unsafe_allow_html=True)
     
-    # Add spacing before store cards
-    st.markdown("<div style='margin-top: 1.5rem;'></div>", unsafe_allow_html=True)
-    
-    # Create store breakdown using small metric cards
+    # Create store breakdown using small metric cards, sent as a single element
     if sorted_stores:
-        # Create rows of 3 columns each for store cards
         num_stores_to_show = min(12, len(sorted_stores))  # Show up to 12 stores
-        for i in range(0, num_stores_to_show, 3):
-            cols = st.columns(3, gap="medium")
-            for j in range(3):
-                if i + j < num_stores_to_show:
-                    store_name, count = sorted_stores[i + j]
-                    with cols[j]:
-                        # Truncate store name if too long
-                        display_name = store_name[:15] + "..." if len(store_name) > 15 else store_name
-                        
-                        # Create a small metric card for each store
-                        st.markdown(f"""
-                        <div class="store-metric-card">
-                            <div class="store-name" title="{store_name}">{display_name}</div>
-                            <div class="store-count">{count}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-            
-            # Add spacing between rows (except after the last row)
-            if i + 3 < num_stores_to_show:
-                st.markdown("<div style='margin-bottom: 0.75rem;'></div>", unsafe_allow_html=True)
+        
+        cards = []
+        for store_name, count in sorted_stores[:num_stores_to_show]:
+            # Truncate store name if too long
+            display_name = store_name[:15] + "..." if len(store_name) > 15 else store_name
+            cards.append(
+                f'<div class="store-metric-card">'
+                f'<div class="store-name" title="{store_name}">{display_name}</div>'
+                f'<div class="store-count">{count}</div>'
+                f'</div>'
+            )
         
         # Show remaining stores count if there are more
+        remaining_note = ""
         if len(sorted_stores) > num_stores_to_show:
             remaining = len(sorted_stores) - num_stores_to_show
-            st.markdown(f"""
-            <div style="color: #28666e; font-size: 0.85rem; font-style: italic; margin-top: 0.5rem; opacity: 0.7; text-align: center;">
-                ...and {remaining} more stores
-            </div>
-            """, unsafe_allow_html=True)
+            remaining_note = (
+                '<div style="color: #28666e; font-size: 0.85rem; font-style: italic; margin-top: 0.5rem; opacity: 0.7; text-align: center;">'
+                f'...and {remaining} more stores'
+                '</div>'
+            )
+        
+        st.markdown(f'<div class="store-grid">{"".join(cards)}</div>{remaining_note}', unsafe_allow_html=True)
     else:
         st.markdown("""
         <div style="color: #28666e; font-size: 0.9rem; opacity: 0.7;">
@@ -463,69 +597,147 @@ def create_upcoming_pickups_column(data: dict, summary: dict):
         </div>
         """, unsafe_allow_html=True)
 
+# Columns offered as selectbox filters in the data tables
+FILTER_COLUMNS = ['Carrier Name', 'Carrier', 'Status', 'Store']
+
+def _categorize_filter_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store filter columns as categoricals so their sorted distinct values live on the dtype."""
+    for col in FILTER_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def _filter_options(df: pd.DataFrame, col: str) -> list:
+    """Return 'All' followed by the sorted distinct values of a filter column."""
+    values = df[col]
+    if isinstance(values.dtype, _pd().CategoricalDtype):
+        return ['All'] + values.cat.categories.tolist()
+    return ['All'] + sorted(values.dropna().unique().tolist())
+
+@st.cache_data(ttl=900, show_spinner=False)
+def process_freightview_data(_rows: list, direction: str, digest: str) -> pd.DataFrame:
+    """Build the FreightView table for one direction from its processed rows, cached on the shipments payload digest."""
+    columns = INBOUND_COLUMNS if direction == "inbound" else OUTBOUND_COLUMNS
+    return _categorize_filter_columns(_pd().DataFrame.from_records(_rows, columns=columns))
+
+@st.cache_data(ttl=900, show_spinner=False)
+def process_shipstation_orders_data(_order_columns: dict, orders_digest: str, stores_digest: str) -> pd.DataFrame:
+    """Build the ShipStation orders table from the processed columns, cached on the orders and stores payload digests."""
+    return _categorize_filter_columns(_pd().DataFrame(_order_columns))
+
+@st.cache_data(ttl=900, show_spinner=False)
+def process_shipstation_shipments_data(_unified_service: UnifiedDataService, _shipments, digest: str) -> pd.DataFrame:
+    """Build the ShipStation shipments table, cached on the shipments payload digest."""
+    return _categorize_filter_columns(_pd().DataFrame(_unified_service.process_shipstation_shipments(_shipments)))
+
+@st.cache_data(ttl=900, show_spinner=False)
+def process_airtable_data(_unified_service: UnifiedDataService, _pickups, digest: str) -> pd.DataFrame:
+    """Build the upcoming pickups table, cached on the Airtable records digest."""
+    # The raw date is only kept for sorting and is not displayed
+    df = _pd().DataFrame(_unified_service.process_airtable_pickups(_pickups)).drop(
+        columns=['_ready_date_raw'], errors='ignore'
+    )
+    return _categorize_filter_columns(df)
+
+def build_tables(unified_service: UnifiedDataService, all_data: dict, digests: dict, processed: dict) -> dict:
+    """Build every data table for a loaded payload; tables for unavailable services are left out.
+    
+    processed holds the FreightView rows and ShipStation order columns already processed by load_all.
+    """
+    dfs = {}
+    ss_data = all_data["shipstation"]
+    at_raw = all_data.get("airtable", {}).get("upcoming_pickups")
+    
+    if "fv_in" in processed:
+        with timed(st.session_state.timings, "FreightView inbound table"):
+            dfs["fv_in"] = process_freightview_data(processed["fv_in"], "inbound", digests["freightview"])
+        with timed(st.session_state.timings, "FreightView outbound table"):
+            dfs["fv_out"] = process_freightview_data(processed["fv_out"], "outbound", digests["freightview"])
+    
+    if "ss_ord" in processed:
+        with timed(st.session_state.timings, "ShipStation orders table"):
+            dfs["ss_ord"] = process_shipstation_orders_data(
+                processed["ss_ord"], digests["ss_orders"], digests["ss_stores"]
+            )
+    
+    if ss_data["shipments"]:
+        with timed(st.session_state.timings, "ShipStation shipments table"):
+            dfs["ss_ship"] = process_shipstation_shipments_data(unified_service, ss_data["shipments"], digests["ss_shipments"])
+    
+    if at_raw:
+        with timed(st.session_state.timings, "Airtable pickups table"):
+            dfs["at_pickups"] = process_airtable_data(unified_service, at_raw, digests["airtable"])
+    
+    return dfs
+
 # Chart functions removed per user request - keeping space for cleaner layout
 
-def style_old_orders(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply styling to highlight old orders (>3 days)."""
-    def highlight_old_rows(row):
-        """Highlight rows where order date is over 3 days old."""
-        if '_order_date_raw' in row and row['_order_date_raw']:
-            try:
-                # Parse the ISO date
-                order_date_str = str(row['_order_date_raw'])
-                order_date = datetime.fromisoformat(order_date_str.replace('Z', '+00:00').split('.')[0])
-                
-                # Calculate age in days
-                days_old = (datetime.now() - order_date).days
-                
-                # Apply yellow background with red text if over 3 days old
-                if days_old > 3:
-                    return ['background-color: #fedc97; color: #d32f2f'] * len(row)
-            except:
-                pass
-        
-        return [''] * len(row)
+def _currency_columns(columns) -> list:
+    """Return the money columns that should be displayed as currency."""
+    return [
+        col for col in columns
+        if col != '_order_date_raw' and ('Cost' in col or 'Price' in col or 'Total' in col or 'Value' in col)
+    ]
+
+
+def _currency_column_config(columns) -> dict:
+    """Column config that lets the browser render money columns as $1,234.56 while keeping them numeric."""
+    return {col: st.column_config.NumberColumn(format="$%.2f") for col in _currency_columns(columns)}
+
+
+def _highlight_rows(df: pd.DataFrame, row_mask) -> pd.DataFrame:
+    """Highlight the rows selected by a boolean mask with a single Styler call."""
+    import numpy as np
     
-    # Apply the styling
-    styled_df = df.style.apply(highlight_old_rows, axis=1)
-    return styled_df
+    styles = np.where(row_mask[:, None], 'background-color: #fedc97; color: #d32f2f', '')
+    return df.style.apply(lambda _: np.broadcast_to(styles, df.shape), axis=None)
+
+
+def style_old_orders(df: pd.DataFrame, order_dates_raw: pd.Series) -> pd.DataFrame:
+    """Apply styling to highlight old orders (>3 days) given their raw ISO order dates."""
+    pd = _pd()
+    
+    # Parse every order date in one call; missing or unparseable dates become NaT
+    order_dates = pd.to_datetime(order_dates_raw, format='ISO8601', utc=True, errors='coerce')
+    days_old = (pd.Timestamp.now(tz='UTC') - order_dates).dt.days
+    
+    # Apply yellow background with red text if over 3 days old
+    return _highlight_rows(df, days_old.gt(3).to_numpy())
 
 
 def style_old_freightview(df: pd.DataFrame) -> pd.DataFrame:
     """Apply styling to highlight FreightView shipments with Last Update >8 days old."""
-    def highlight_old_rows(row):
-        """Highlight rows where Last Update is over 8 days old."""
-        if 'Last Update' in row and row['Last Update'] != 'N/A':
-            try:
-                # Parse the date - it could be a date object or string
-                last_update = row['Last Update']
-                
-                if isinstance(last_update, str) and last_update != 'N/A':
-                    # Try to parse string date
-                    from datetime import datetime as dt
-                    last_update_date = dt.strptime(last_update, '%Y-%m-%d').date()
-                elif hasattr(last_update, 'date'):
-                    # It's a datetime object
-                    last_update_date = last_update.date() if hasattr(last_update, 'date') else last_update
-                else:
-                    # It's already a date object
-                    last_update_date = last_update
-                
-                # Calculate age in days
-                from datetime import date
-                days_old = (date.today() - last_update_date).days
-                
-                # Apply yellow background with red text if over 8 days old
-                if days_old > 8:
-                    return ['background-color: #fedc97; color: #d32f2f'] * len(row)
-            except Exception:
-                pass
-        
-        return [''] * len(row)
+    pd = _pd()
+    
+    # Classify the whole column at once instead of parsing each row; 'N/A' becomes NaT
+    last_update = df['Last Update']
+    last_update = pd.to_datetime(last_update.mask(last_update.eq('N/A')), errors='coerce')
+    days_old = (pd.Timestamp.today().normalize() - last_update).dt.days
     
-    # Apply the styling
-    styled_df = df.style.apply(highlight_old_rows, axis=1)
-    return styled_df
+    # Apply yellow background with red text if over 8 days old
+    return _highlight_rows(df, days_old.gt(8).to_numpy())
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a table for download, cached so unchanged tables are not re-encoded every rerun."""
+    return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def _to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a table as zstd-compressed Parquet, which keeps column types and is much smaller than CSV."""
+    # Arrow needs one type per column, so mixed object columns (e.g. dates alongside "N/A") are written as text
+    infer_dtype = _pd().api.types.infer_dtype
+    mixed_cols = [
+        col for col in df.columns
+        if df[col].dtype == object and infer_dtype(df[col], skipna=True).startswith("mixed")
+    ]
+    df = df.astype({col: "string" for col in mixed_cols})
+    
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+    return buffer.getvalue()
 
 
 def create_data_table(df: pd.DataFrame, title: str, service_type: str):
@@ -546,13 +758,13 @@ def create_data_table(df: pd.DataFrame, title: str, service_type: str):
         # Service-specific filters
         if service_type == "freightview":
             if "Carrier Name" in df.columns:
-                carriers = ['All'] + sorted(df['Carrier Name'].dropna().unique().tolist())
+                carriers = _filter_options(df, 'Carrier Name')
                 selected_carrier = st.selectbox(f"Filter by Carrier", carriers, key=f"carrier_{title}")
             else:
                 selected_carrier = 'All'
         else:
             if "Carrier" in df.columns:
-                carriers = ['All'] + sorted(df['Carrier'].dropna().unique().tolist())
+                carriers = _filter_options(df, 'Carrier')
                 selected_carrier = st.selectbox(f"Filter by Carrier", carriers, key=f"carrier_{title}")
             else:
                 selected_carrier = 'All'
@@ -560,11 +772,11 @@ def create_data_table(df: pd.DataFrame, title: str, service_type: str):
     with col2:
         # Special handling for ShipStation Orders - filter by Store instead of Status
         if "ShipStation Pending Orders" in title and "Store" in df.columns:
-            stores = ['All'] + sorted(df['Store'].dropna().unique().tolist())
+            stores = _filter_options(df, 'Store')
             selected_store = st.selectbox(f"Filter by Store", stores, key=f"store_{title}")
             selected_status = 'All'  # Not used for ShipStation Orders
         elif "Status" in df.columns:
-            statuses = ['All'] + sorted(df['Status'].dropna().unique().tolist())
+            statuses = _filter_options(df, 'Status')
             selected_status = st.selectbox(f"Filter by Status", statuses, key=f"status_{title}")
             selected_store = 'All'  # Not used for other tables
         else:
@@ -574,91 +786,78 @@ def create_data_table(df: pd.DataFrame, title: str, service_type: str):
     with col3:
         search_term = st.text_input(f"Search {title}", key=f"search_{title}")
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters by combining every condition into one mask and indexing once
+    import numpy as np
+    
+    mask = np.ones(len(df), dtype=bool)
     
     if selected_carrier != 'All':
         carrier_col = "Carrier Name" if "Carrier Name" in df.columns else "Carrier"
-        if carrier_col in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df[carrier_col] == selected_carrier]
+        if carrier_col in df.columns:
+            mask &= (df[carrier_col] == selected_carrier).to_numpy()
     
     # Apply store filter for ShipStation Orders, status filter for others
-    if "ShipStation Pending Orders" in title and 'Store' in filtered_df.columns:
-        if 'selected_store' in locals() and selected_store != 'All':
-            filtered_df = filtered_df[filtered_df['Store'] == selected_store]
-    elif selected_status != 'All' and 'Status' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Status'] == selected_status]
+    if "ShipStation Pending Orders" in title and 'Store' in df.columns:
+        if selected_store != 'All':
+            mask &= (df['Store'] == selected_store).to_numpy()
+    elif selected_status != 'All' and 'Status' in df.columns:
+        mask &= (df['Status'] == selected_status).to_numpy()
     
     if search_term:
-        mask = filtered_df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
-        filtered_df = filtered_df[mask]
+        # Scan only text-like and integer (ID) columns; float money/weight columns are skipped
+        search_cols = df.select_dtypes(include=['object', 'string', 'category', 'integer']).columns
+        search_mask = np.zeros(len(df), dtype=bool)
+        for col in search_cols:
+            search_mask |= df[col].astype('string').str.contains(
+                search_term, case=False, na=False, regex=False
+            ).to_numpy()
+        mask &= search_mask
+    
+    filtered_df = df[mask]
     
     # Display table
     if not filtered_df.empty:
-        # Create display dataframe and remove the raw date column for display
-        display_df = filtered_df.copy()
+        # Split off the raw date column once; it only drives highlighting.
+        # Masking already produced a new frame, so drop the column instead of copying it again
+        raw_dates = filtered_df.get('_order_date_raw')
+        display_df = filtered_df.drop(columns=['_order_date_raw'], errors='ignore')
+        
+        # Money columns stay numeric; the browser formats them and sorts them as numbers
+        column_config = _currency_column_config(display_df.columns)
         
         # Check if this is ShipStation Orders table and apply row highlighting
-        if "ShipStation Pending Orders" in title and '_order_date_raw' in display_df.columns:
+        if "ShipStation Pending Orders" in title and raw_dates is not None:
             # Apply styling for old orders
-            styled_df = style_old_orders(display_df)
-            
-            # Format currency columns in the styled dataframe
-            format_dict = {}
-            for col in display_df.columns:
-                if col != '_order_date_raw' and ('Cost' in col or 'Price' in col or 'Total' in col or 'Value' in col):
-                    format_dict[col] = lambda x: f"${x:,.2f}" if pd.notna(x) and x != 0 else "N/A"
-            
-            if format_dict:
-                styled_df = styled_df.format(format_dict)
-            
-            # Hide the raw date column from display
-            if '_order_date_raw' in display_df.columns:
-                styled_df = styled_df.hide(axis='columns', subset=['_order_date_raw'])
+            styled_df = style_old_orders(display_df, raw_dates)
             
             # Display the styled dataframe
-            st.dataframe(styled_df, use_container_width=True, height=400)
+            st.dataframe(styled_df, column_config=column_config, use_container_width=True, height=400)
         # Check if this is a FreightView table and apply row highlighting
         elif ("FreightView Inbound" in title or "FreightView Outbound" in title) and 'Last Update' in display_df.columns:
             # Apply styling for old FreightView shipments
             styled_df = style_old_freightview(display_df)
             
-            # Format currency columns in the styled dataframe
-            for col in display_df.columns:
-                if 'Cost' in col or 'Price' in col or 'Total' in col or 'Value' in col:
-                    styled_df = styled_df.format({col: lambda x: f"${x:,.2f}" if pd.notna(x) and x != 0 else "N/A"})
-            
             # Display the styled dataframe
-            st.dataframe(styled_df, use_container_width=True, height=400)
+            st.dataframe(styled_df, column_config=column_config, use_container_width=True, height=400)
         else:
             # Standard display for other tables
-            # Remove raw date column if present
-            if '_order_date_raw' in display_df.columns:
-                display_df = display_df.drop('_order_date_raw', axis=1)
-            
-            # Format currency columns
-            for col in display_df.columns:
-                if 'Cost' in col or 'Price' in col or 'Total' in col or 'Value' in col:
-                    display_df[col] = display_df[col].apply(
-                        lambda x: x if isinstance(x, str) else (f"${x:,.2f}" if pd.notna(x) and x != 0 else "N/A")
-                    )
-            
-            st.dataframe(display_df, use_container_width=True, height=400)
+            st.dataframe(display_df, column_config=column_config, use_container_width=True, height=400)
         
-        # Export button - use original filtered_df for export (excluding internal columns)
-        export_df = filtered_df.copy()
-        # Remove any internal columns from export
-        internal_cols = ['_order_date_raw']
-        for col in internal_cols:
-            if col in export_df.columns:
-                export_df = export_df.drop(col, axis=1)
-        csv = export_df.to_csv(index=False)
+        # Export buttons - export the unformatted display rows, which exclude internal columns
+        file_stem = f"{title.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        csv = _to_csv_bytes(display_df)
         st.download_button(
             label=f"📥 Download {title} Data",
             data=csv,
-            file_name=f"{title.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            file_name=f"{file_stem}.csv",
             mime="text/csv"
         )
+        st.download_button(
+            label=f"📦 Download {title} Parquet",
+            data=_to_parquet_bytes(display_df),
+            file_name=f"{file_stem}.parquet",
+            mime="application/octet-stream"
+        )
     else:
         st.info("No data matches the current filters")
     
@@ -666,6 +865,7 @@ def create_data_table(df: pd.DataFrame, title: str, service_type: str):
 
 def main():
     initialize_session_state()
+    _inject_css()
     
     # Header
     st.markdown("""
@@ -675,112 +875,58 @@ def main():
     """, unsafe_allow_html=True)
     
     # Get configuration and initialize service
+    credentials = get_config()
     try:
-        fv_client_id, fv_client_secret, ss_api_key, ss_api_secret, at_api_key, at_base_id, at_table_name = get_config()
-        unified_service = UnifiedDataService(
-            fv_client_id, fv_client_secret, 
-            ss_api_key, ss_api_secret,
-            at_api_key, at_base_id, at_table_name
-        )
+        unified_service = get_unified_service(*credentials)
     except Exception as e:
         st.error(f"Service initialization error: {str(e)}")
         st.stop()
     
-    # Control panel
-    col1, col2, col3 = st.columns([2, 1, 1])
-    
-    with col1:
-        if st.session_state.last_update:
-            next_update = st.session_state.last_update + timedelta(minutes=15)
-            time_until_next = next_update - datetime.now()
-            if time_until_next.total_seconds() > 0:
-                minutes_left = int(time_until_next.total_seconds() / 60)
-                st.markdown(f"""
-                <div class="refresh-info">
-                    ⏰ Next auto-refresh in: {minutes_left} minutes | 
-                    Last updated: {st.session_state.last_update.strftime('%Y-%m-%d %H:%M:%S')}
-                </div>
-                """, unsafe_allow_html=True)
-    
-    with col2:
-        if st.button("🔄 Refresh All Data", type="primary"):
-            st.session_state.last_update = None
-            st.rerun()
-    
-    with col3:
-        auto_refresh = st.toggle("🔄 Auto-refresh", value=st.session_state.auto_refresh_enabled)
-        st.session_state.auto_refresh_enabled = auto_refresh
+    # Load data; identical reruns inside the cache TTL are served from load_all's cache
+    try:
+        with st.spinner("🔄 Loading data from all services..."):
+            with timed(st.session_state.timings, "Load all data"):
+                all_data, summary, fetch_timings, loaded_at, digests, processed = load_all(
+                    *credentials, refresh_token=st.session_state.refresh_token
+                )
+        st.session_state.timings.update(fetch_timings)
+        
+        # Store in session state
+        st.session_state.update({
+            "all_data": all_data,
+            "summary": summary,
+            "last_update": loaded_at,
+            "payload_digests": digests,
+            "processed": processed,
+            "data_loaded": True
+        })
+    except Exception as e:
+        st.session_state.update({
+            "error_message": f"Error loading data: {str(e)}",
+            "data_loaded": False
+        })
     
-    # Check if we need to refresh data
-    should_refresh = (
-        st.session_state.last_update is None or
-        (st.session_state.auto_refresh_enabled and 
-         datetime.now() - st.session_state.last_update > timedelta(minutes=15))
-    )
+    # Control panel and service status columns (auto-refreshing fragment)
+    summary_panel(credentials)
     
-    if should_refresh:
-        with st.spinner("🔄 Loading data from all services..."):
-            try:
-                all_data = unified_service.fetch_all_data()
-                summary = unified_service.get_unified_summary(all_data)
-                
-                # Store in session state
-                st.session_state.all_data = all_data
-                st.session_state.summary = summary
-                st.session_state.last_update = datetime.now()
-                st.session_state.data_loaded = True
-                
-                st.success("✅ Data loaded from all services!")
-                time.sleep(1)
-                st.rerun()
-                
-            except Exception as e:
-                st.session_state.error_message = f"Error loading data: {str(e)}"
-                st.session_state.data_loaded = False
-    
-    # Display service status in two clean columns
+    # Display data tables
     if st.session_state.data_loaded:
-        # Add inbound/outbound counts to summary
-        if st.session_state.all_data["freightview"]["shipments"]:
-            fv_inbound = unified_service.freight_service.process_inbound_data(st.session_state.all_data["freightview"]["shipments"])
-            fv_outbound = unified_service.freight_service.process_outbound_data(st.session_state.all_data["freightview"]["shipments"])
-            st.session_state.summary["freightview"]["inbound_count"] = len(fv_inbound)
-            st.session_state.summary["freightview"]["outbound_count"] = len(fv_outbound)
+        pd = _pd()
         
-        # Create three-column layout
-        col1, col2, col3 = st.columns(3)
+        summary = st.session_state.summary
         
-        with col1:
-            create_freight_view_column(st.session_state.all_data, st.session_state.summary)
+        # Build the tables only when load_all returned a new load; other reruns reuse them from the session.
+        # The builders are cached on payload digests, so a refresh with unchanged data is cheap as well
+        if st.session_state.dfs_loaded_at != st.session_state.last_update:
+            st.session_state.dfs = build_tables(
+                unified_service, st.session_state.all_data, st.session_state.payload_digests,
+                st.session_state.processed
+            )
+            st.session_state.dfs_loaded_at = st.session_state.last_update
+        dfs = st.session_state.dfs
         
-        with col2:
-            create_shipstation_column(st.session_state.all_data, st.session_state.summary)
-        
-        with col3:
-            if "airtable" in st.session_state.summary:
-                create_upcoming_pickups_column(st.session_state.all_data, st.session_state.summary)
-            else:
-                # Show placeholder if Airtable not configured
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(to bottom right, #f5f7f3, #e8ede5);
-                    border: 1.5px solid #7c9885;
-                    border-left: 4px solid #7c9885;
-                    border-radius: 12px;
-                    padding: 1.2rem;
-                    height: 100%;
-                    box-shadow: 0 2px 8px rgba(124, 152, 133, 0.12);
-                ">
-                    <div style="display: flex; align-items: center; margin-bottom: 1rem; padding-bottom: 0.5rem; border-bottom: 2px solid #7c9885;">
-                        <span style="font-size: 1.5rem; margin-right: 0.5rem;">📅</span>
-                        <span style="font-size: 1.1rem; font-weight: 600; color: #033f63;">Upcoming Pickups</span>
-                        <span style="margin-left: auto; font-size: 0.9rem;">⚠️</span>
-                    </div>
-                    <div style="color: #28666e; font-size: 0.9rem; opacity: 0.7; text-align: center; margin-top: 1rem;">
-                        Airtable not configured
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        # Filled in once the tables below have been displayed
+        perf_expander = st.expander("🛠 perf")
         
         st.markdown("---")
         
@@ -793,76 +939,59 @@ def main():
         ]
         
         # Add Airtable tab if configured
-        if "airtable" in st.session_state.summary and st.session_state.summary["airtable"]["status"] == "connected":
+        if "airtable" in summary and summary["airtable"]["status"] == "connected":
             tab_names.append("📅 Upcoming Pickups")
             tab1, tab2, tab3, tab4, tab5 = st.tabs(tab_names)
         else:
             tab1, tab2, tab3, tab4 = st.tabs(tab_names)
         
-        # Process and display FreightView data
-        if st.session_state.all_data["freightview"]["shipments"]:
-            fv_inbound = unified_service.freight_service.process_inbound_data(st.session_state.all_data["freightview"]["shipments"])
-            fv_outbound = unified_service.freight_service.process_outbound_data(st.session_state.all_data["freightview"]["shipments"])
-            
+        # Display FreightView data
+        if "fv_in" in dfs:
             with tab1:
-                create_data_table(pd.DataFrame(fv_inbound), "FreightView Inbound Freight", "freightview")
+                create_data_table(dfs["fv_in"], "FreightView Inbound Freight", "freightview")
             
             with tab2:
-                create_data_table(pd.DataFrame(fv_outbound), "FreightView Outbound Freight", "freightview")
+                create_data_table(dfs["fv_out"], "FreightView Outbound Freight", "freightview")
         else:
             with tab1:
                 st.error("❌ FreightView inbound data unavailable")
             with tab2:
                 st.error("❌ FreightView outbound data unavailable")
         
-        # Process and display ShipStation data
-        if st.session_state.all_data["shipstation"]["orders"]:
-            ss_orders = unified_service.process_shipstation_orders(
-                st.session_state.all_data["shipstation"]["orders"],
-                st.session_state.all_data["shipstation"]["stores"]
-            )
-            
-            with tab3:
-                create_data_table(pd.DataFrame(ss_orders), "ShipStation Pending Orders", "shipstation")
-        else:
-            with tab3:
+        # Display ShipStation data
+        with tab3:
+            if "ss_ord" in dfs:
+                create_data_table(dfs["ss_ord"], "ShipStation Pending Orders", "shipstation")
+            else:
                 st.error("❌ ShipStation orders data unavailable")
         
-        if st.session_state.all_data["shipstation"]["shipments"]:
-            ss_shipments = unified_service.process_shipstation_shipments(st.session_state.all_data["shipstation"]["shipments"])
-            
-            with tab4:
-                create_data_table(pd.DataFrame(ss_shipments), "ShipStation Recent Shipments", "shipstation")
-        else:
-            with tab4:
+        with tab4:
+            if "ss_ship" in dfs:
+                create_data_table(dfs["ss_ship"], "ShipStation Recent Shipments", "shipstation")
+            else:
                 st.error("❌ ShipStation shipments data unavailable")
         
-        # Process and display Airtable data if available
-        if "airtable" in st.session_state.summary and st.session_state.summary["airtable"]["status"] == "connected":
-            if st.session_state.all_data["airtable"]["upcoming_pickups"]:
-                at_pickups = unified_service.process_airtable_pickups(st.session_state.all_data["airtable"]["upcoming_pickups"])
-                
-                with tab5:
-                    # Remove the raw date column before creating DataFrame
-                    display_pickups = []
-                    for pickup in at_pickups:
-                        display_pickup = pickup.copy()
-                        if '_ready_date_raw' in display_pickup:
-                            del display_pickup['_ready_date_raw']
-                        display_pickups.append(display_pickup)
-                    
-                    create_data_table(pd.DataFrame(display_pickups), "Upcoming Pickups", "airtable")
-            else:
-                with tab5:
+        # Display Airtable data if available
+        if "airtable" in summary and summary["airtable"]["status"] == "connected":
+            with tab5:
+                if "at_pickups" in dfs:
+                    create_data_table(dfs["at_pickups"], "Upcoming Pickups", "airtable")
+                else:
                     st.info("📅 No upcoming pickups scheduled for this week")
+        
+        # Show the most recent timing of every fetch and processing step
+        with perf_expander:
+            st.dataframe(
+                pd.DataFrame(
+                    [(label, round(seconds * 1000, 1)) for label, seconds in st.session_state.timings.items()],
+                    columns=["Step", "Time (ms)"]
+                ),
+                hide_index=True,
+                use_container_width=True
+            )
     
     else:
         st.info("👆 Click 'Refresh All Data' to load shipping data from all services")
-    
-    # Auto-refresh logic
-    if st.session_state.auto_refresh_enabled and st.session_state.data_loaded:
-        time.sleep(60)
-        st.rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
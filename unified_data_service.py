@@ -6,16 +6,26 @@ import requests
 import logging
 import os
 import base64
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 import streamlit as st
+# Internal Streamlit API (no public equivalent): worker threads need the session's
+# ScriptRunContext, otherwise st.cache_data calls from them warn and run without it
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import existing models and services
-from data_service import FreightDataService
-from shipstation_models import ShipStationOrdersResponse, ShipStationShipmentsResponse
+from data_service import FreightDataService, REQUEST_TIMEOUT, RETRY_POLICY
+from shipstation_models import (
+    ShipStationOrderListing, ShipStationOrdersListingResponse,
+    ShipStationShipmentListing, ShipStationShipmentsListingResponse
+)
 from freightviewslack.pydatamodel import Model
-from airtable_service import AirtableService
 
 # Load environment variables
 try:
@@ -24,6 +34,200 @@ try:
 except ImportError:
     pass
 
+# pyairtable is slow to import and Airtable is optional, so AirtableService is only
+# imported once a service is actually configured (see _airtable_service_class)
+AirtableService = None
+
+def _airtable_service_class():
+    """Return the AirtableService class, importing it on first use."""
+    global AirtableService
+    if AirtableService is None:
+        from airtable_service import AirtableService
+    return AirtableService
+
+# Column order of the processed ShipStation tables
+ORDER_COLUMNS = [
+    "Order ID", "Store", "Status", "Customer", "Ship To", "Items", "Order Total",
+    "Weight", "Order Date", "Ship Date", "Carrier", "Service", "_order_date_raw"
+]
+SHIPMENT_COLUMNS = [
+    "Shipment ID", "Order Number", "Customer", "Ship To", "Tracking", "Carrier",
+    "Service", "Weight", "Weight Unit", "Cost", "Ship Date", "Voided"
+]
+
+# Processed rows are plain tuples in column order: they carry no per-row __dict__ and
+# transpose straight into columns, and build faster than NamedTuples or slots dataclasses
+OrderRow = Tuple[
+    Optional[str], str, Optional[str], str, str, int, float,
+    Tuple[Optional[float], Optional[str]], Optional[str], str, str, str, Optional[str]
+]
+ShipmentRow = Tuple[
+    Optional[int], Optional[str], str, str, str, str, str, float, str, float, Optional[str], bool
+]
+
+# Store name abbreviation dictionary
+STORE_ABBREVIATIONS = {
+    'Bala': 'Bala',
+    'Body Nutrition - Wholesale': 'Wholesale',
+    'Gym Molly Store': 'Gym Molly',
+    'MWL Buyside Store': 'MWL',
+    'Manual Orders': 'Manual',
+    'MediWeight OLD Orders': 'MWL OLD',
+    'New Amazon Store': 'Amazon',
+    'Rate Browser': 'Unused',
+    'Shopify Store': 'Shopify',
+    'TestRateShopping': 'TEST'
+}
+
+def build_store_map(stores_data: Optional[list]) -> Dict[str, str]:
+    """Map ShipStation store IDs to store names."""
+    store_id_to_name = {}
+    for store in stores_data or []:
+        # Records come straight from the API's JSON, so only malformed ones take the except path
+        try:
+            store_id, store_name = store['storeId'], store['storeName']
+        except (KeyError, TypeError):
+            continue
+        if store_id and store_name:
+            # The stores payload is raw JSON, so make sure names are strings before they are stripped
+            store_id_to_name[str(store_id)] = str(store_name)
+    return store_id_to_name
+
+def _to_columns(rows: List[Tuple],  columns: List[str]) -> Dict[str, List]:
+    """Transpose row tuples into a dict of column lists."""
+    if not rows:
+        return {column: [] for column in columns}
+    return dict(zip(columns, map(list, zip(*rows))))
+
+def _fmt_date(value: Optional[str]) -> Optional[str]:
+    """Format an ISO date string (YYYY-MM-DD...) as M/D/YYYY by slicing; anything else is returned unchanged."""
+    if not value or len(value) < 10 or value[4] != '-' or value[7] != '-':
+        return value
+    try:
+        return f"{int(value[5:7])}/{int(value[8:10])}/{value[0:4]}"
+    except ValueError:
+        return value
+
+# Multiplier from each (lower-cased) ShipStation weight unit to ounces
+_UNIT_TO_OZ = {
+    'lbs': 16.0,
+    'lb': 16.0,
+    'pounds': 16.0,
+    'oz': 1.0,
+    'ounces': 1.0
+}
+
+def _format_weights(values: Tuple[Optional[float], ...], units: Tuple[Optional[str], ...]) -> List[str]:
+    """Format order weights for display in one vectorized pass.
+    
+    Pound and ounce weights are shown in lbs from 16 oz up and in oz below that,
+    other units are shown as given, and orders without a weight show N/A.
+    """
+    import numpy as np
+    
+    weight = np.asarray(values, dtype="float64")
+    unit = np.asarray(units, dtype=object)
+    
+    # Convert to ounces with a single lookup of each unit's multiplier; NaN marks unknown units.
+    # A plain dict lookup per unit is far cheaper than building pandas objects for a few hundred orders
+    multiplier = np.fromiter(
+        (_UNIT_TO_OZ.get(u.lower(), np.nan) if u else np.nan for u in units), dtype="float64", count=len(units)
+    )
+    weight_in_oz = weight * multiplier
+    in_lbs = weight_in_oz >= 16
+    in_oz = weight_in_oz < 16
+    
+    display = np.full(len(weight), "N/A", dtype=object)
+    display[in_lbs] = np.char.add(np.char.mod("%.1f", weight_in_oz[in_lbs] / 16), " lbs")
+    display[in_oz] = np.char.add(np.char.mod("%.1f", weight_in_oz[in_oz]), " oz")
+    
+    # Unknown units keep the original value and unit
+    other = np.isnan(multiplier) & ~np.isnan(weight)
+    display[other] = np.char.add(np.char.mod("%.1f ", weight[other]), unit[other].astype(str))
+    return display.tolist()
+
+def _process_order(order: ShipStationOrderListing, store_id_to_name: Dict[str, str]) -> OrderRow:
+    """Build one ORDER_COLUMNS row; optional fields are guarded inline. The Weight cell holds (value, unit)."""
+    # Calculate total items
+    total_items = sum(item.quantity or 0 for item in order.items) if order.items else 0
+    
+    # Get store information: store ID lives in advancedOptions
+    store_name = "Unknown Store"
+    store_id = order.advancedOptions.storeId if order.advancedOptions else None
+    if store_id:
+        # Mapped names are never empty, so a miss falls back to "Store <id>"
+        store_key = str(store_id)
+        store_name = (store_id_to_name.get(store_key) or f"Store {store_key}").strip()
+    
+    # Apply abbreviation
+    store_name = STORE_ABBREVIATIONS.get(store_name, store_name)
+    
+    # Raw weight; process_shipstation_orders formats the whole Weight column at once
+    weight_value = None
+    weight_unit = None
+    if order.weight and order.weight.value:
+        weight_value = order.weight.value
+        weight_unit = order.weight.units or "LBS"
+    
+    # Format order date to M/D/YYYY
+    order_date_formatted = _fmt_date(order.orderDate)
+    
+    # Get shipping info
+    ship_to_company = ""
+    ship_to_city = ""
+    if order.shipTo:
+        ship_to_company = order.shipTo.company or order.shipTo.name or ""
+        ship_to_city = order.shipTo.city or ""
+    
+    # One tuple per order in ORDER_COLUMNS order
+    return (
+        order.orderNumber,
+        store_name,
+        order.orderStatus,
+        order.customerEmail or "N/A",
+        f"{ship_to_company} ({ship_to_city})",
+        total_items,
+        order.orderTotal or 0,
+        (weight_value, weight_unit),
+        order_date_formatted,
+        order.shipDate or "Not Shipped",
+        order.carrierCode or "Not Assigned",
+        order.requestedShippingService or "N/A",
+        order.orderDate  # Keep raw date for age calculation
+    )
+
+def _process_shipment(shipment: ShipStationShipmentListing) -> ShipmentRow:
+    """Build one SHIPMENT_COLUMNS row; optional fields are guarded inline."""
+    # Get weight info
+    weight = 0
+    weight_unit = "LBS"
+    if shipment.weight:
+        weight = shipment.weight.value or 0
+        weight_unit = shipment.weight.units or "LBS"
+    
+    # Get shipping address
+    ship_to = ""
+    if shipment.shipTo:
+        company = shipment.shipTo.company or shipment.shipTo.name or ""
+        city = shipment.shipTo.city or ""
+        ship_to = f"{company} ({city})"
+    
+    # One tuple per shipment in SHIPMENT_COLUMNS order
+    return (
+        shipment.shipmentId,
+        shipment.orderNumber,
+        shipment.customerEmail or "N/A",
+        ship_to,
+        shipment.trackingNumber or "No Tracking",
+        shipment.carrierCode or "Unknown",
+        shipment.serviceCode or "N/A",
+        weight,
+        weight_unit,
+        shipment.shipmentCost or 0,
+        shipment.shipDate,
+        shipment.voided or False
+    )
+
 class ShipStationService:
     """Service class for ShipStation API interactions."""
     
@@ -40,10 +244,16 @@ class ShipStationService:
             "Authorization": f"Basic {encoded_credentials}",
             "Content-Type": "application/json"
         }
+        
+        # One pooled session so back-to-back calls reuse the keep-alive connection to ShipStation
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=RETRY_POLICY))
     
-    @st.cache_data(ttl=900)  # Cache for 15 minutes
-    def fetch_orders(_self, status: str = "awaiting_shipment", days_back: int = 30) -> Optional[ShipStationOrdersResponse]:
-        """Fetch orders from ShipStation API."""
+    @st.cache_data(ttl=900)  # Cache for 15 minutes; orders change often
+    def fetch_orders(_self, status: str = "awaiting_shipment", days_back: int = 30,
+                     refresh_token: int = 0) -> Optional[ShipStationOrdersListingResponse]:
+        """Fetch orders from ShipStation API. Pass a new refresh_token to bypass the cached response."""
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
@@ -57,11 +267,11 @@ class ShipStationService:
         
         try:
             url = f"{_self.base_url}/orders"
-            response = requests.get(url, headers=_self.headers, params=params)
+            response = _self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
-                return ShipStationOrdersResponse.model_validate(data)
+                # Parse and validate straight from the response bytes, keeping only the listed fields
+                return ShipStationOrdersListingResponse.model_validate_json(response.content)
             else:
                 _self.logger.error(f"ShipStation API request failed: {response.status_code}")
                 return None
@@ -73,26 +283,27 @@ class ShipStationService:
             _self.logger.error(f"ShipStation request error: {str(e)}")
             return None
     
-    @st.cache_data(ttl=900)
-    def fetch_stores(_self) -> Optional[dict]:
-        """Fetch all stores from ShipStation API."""
+    def fetch_stores(self, refresh_token: int = 0) -> Optional[dict]:
+        """Fetch all stores from ShipStation API. Pass a new refresh_token to bypass the cached response."""
         try:
-            url = f"{_self.base_url}/stores"
-            response = requests.get(url, headers=_self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                _self.logger.error(f"ShipStation stores API failed: {response.status_code}")
-                return None
-                
+            return self._fetch_stores(refresh_token)
         except Exception as e:
-            _self.logger.error(f"ShipStation stores fetch error: {str(e)}")
+            self.logger.error(f"ShipStation stores fetch error: {str(e)}")
             return None
     
-    @st.cache_data(ttl=900)
-    def fetch_shipments(_self, days_back: int = 30) -> Optional[ShipStationShipmentsResponse]:
-        """Fetch shipments from ShipStation API."""
+    @st.cache_data(ttl=6 * 3600)  # Stores rarely change
+    def _fetch_stores(_self, refresh_token: int = 0) -> dict:
+        """Fetch the stores; failures raise so that they are never cached for the long TTL."""
+        url = f"{_self.base_url}/stores"
+        response = _self.session.get(url, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code != 200:
+            raise requests.HTTPError(f"ShipStation stores API failed: {response.status_code}")
+        return response.json()
+    
+    @st.cache_data(ttl=1800)
+    def fetch_shipments(_self, days_back: int = 30, refresh_token: int = 0) -> Optional[ShipStationShipmentsListingResponse]:
+        """Fetch shipments from ShipStation API. Pass a new refresh_token to bypass the cached response."""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
         
@@ -104,11 +315,11 @@ class ShipStationService:
         
         try:
             url = f"{_self.base_url}/shipments"
-            response = requests.get(url, headers=_self.headers, params=params)
+            response = _self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
-                return ShipStationShipmentsResponse.model_validate(data)
+                # Parse and validate straight from the response bytes, keeping only the listed fields
+                return ShipStationShipmentsListingResponse.model_validate_json(response.content)
             else:
                 _self.logger.error(f"ShipStation shipments API failed: {response.status_code}")
                 return None
@@ -117,6 +328,37 @@ class ShipStationService:
             _self.logger.error(f"ShipStation shipments error: {str(e)}")
             return None
 
+# Display names used when logging fetch errors
+SERVICE_NAMES = {
+    "freightview": "FreightView",
+    "shipstation": "ShipStation",
+    "airtable": "Airtable"
+}
+
+@contextmanager
+def timed(timings: Dict[str, float], label: str):
+    """Record how long the wrapped block takes as timings[label], in seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[label] = time.perf_counter() - start
+
+def _timed_call(timings: Dict[str, float], label: str, fetch, *args):
+    """Call fetch(*args), recording its duration in timings under label."""
+    with timed(timings, label):
+        return fetch(*args)
+
+def _submit_in_context(executor: ThreadPoolExecutor, fn, *args):
+    """Submit fn(*args) to run in a copy of the caller's contextvars.
+    
+    Workers do not inherit contextvars. Without the copy, Streamlit does not see that a
+    cached fetch is nested inside load_all, and each cache miss opens its own spinner
+    from a worker thread. Every task gets its own copy, since a Context cannot be
+    entered by two threads at once.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
 class UnifiedDataService:
     """Unified service for FreightView, ShipStation, and Airtable data."""
     
@@ -128,12 +370,18 @@ class UnifiedDataService:
         # Initialize Airtable service if credentials provided
         self.airtable_service = None
         if at_api_key and at_base_id and at_table_name:
-            self.airtable_service = AirtableService(at_api_key, at_base_id, at_table_name)
+            self.airtable_service = _airtable_service_class()(at_api_key, at_base_id, at_table_name)
         
         self.logger = logging.getLogger(__name__)
     
-    def fetch_all_data(self) -> Dict:
-        """Fetch data from all services."""
+    def fetch_all_data(self, refresh_token: int = 0) -> Tuple[Dict, Dict[str, float]]:
+        """Fetch data from all services concurrently.
+        
+        Returns (data, wall-clock seconds per fetch). The timings are fresh for every call,
+        since the service instance is shared by all sessions.
+        A new refresh_token refetches ShipStation orders, shipments and stores instead of serving them from cache.
+        """
+        timings: Dict[str, float] = {}
         data = {
             "freightview": {
                 "shipments": None,
@@ -151,200 +399,75 @@ class UnifiedDataService:
             }
         }
         
-        # Fetch FreightView data
-        try:
-            fv_shipments = self.freight_service.fetch_shipments("picked-up")
-            data["freightview"]["shipments"] = fv_shipments
-        except Exception as e:
-            data["freightview"]["error"] = str(e)
-            self.logger.error(f"FreightView fetch error: {e}")
-        
-        # Fetch ShipStation data
-        try:
-            ss_orders = self.shipstation_service.fetch_orders("awaiting_shipment")
-            ss_shipments = self.shipstation_service.fetch_shipments()
-            ss_stores = self.shipstation_service.fetch_stores()
-            data["shipstation"]["orders"] = ss_orders
-            data["shipstation"]["shipments"] = ss_shipments
-            data["shipstation"]["stores"] = ss_stores
-        except Exception as e:
-            data["shipstation"]["error"] = str(e)
-            self.logger.error(f"ShipStation fetch error: {e}")
-        
-        # Fetch Airtable data
-        if self.airtable_service:
-            try:
-                upcoming_pickups = self.airtable_service.fetch_upcoming_pickups()
-                data["airtable"]["upcoming_pickups"] = upcoming_pickups
-            except Exception as e:
-                data["airtable"]["error"] = str(e)
-                self.logger.error(f"Airtable fetch error: {e}")
+        # The requests are independent and network bound, so run them side by side.
+        # Workers share this run's script context and each task runs in a copy of the caller's
+        # contextvars, so the cached fetches behave as they would on the main thread
+        with ThreadPoolExecutor(max_workers=5, initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as executor:
+            futures = {
+                ("freightview", "shipments"): _submit_in_context(
+                    executor, _timed_call, timings, "FreightView shipments", self.freight_service.fetch_shipments, "picked-up"
+                ),
+                ("shipstation", "orders"): _submit_in_context(
+                    executor, _timed_call, timings, "ShipStation orders", self.shipstation_service.fetch_orders,
+                    "awaiting_shipment", 30, refresh_token
+                ),
+                ("shipstation", "shipments"): _submit_in_context(
+                    executor, _timed_call, timings, "ShipStation shipments", self.shipstation_service.fetch_shipments, 30, refresh_token
+                ),
+                ("shipstation", "stores"): _submit_in_context(
+                    executor, _timed_call, timings, "ShipStation stores", self.shipstation_service.fetch_stores,
+                    refresh_token
+                ),
+            }
+            if self.airtable_service:
+                futures[("airtable", "upcoming_pickups")] = _submit_in_context(
+                    executor, _timed_call, timings, "Airtable pickups", self.airtable_service.fetch_upcoming_pickups
+                )
+            
+            # Collect each result on its own so one failing service does not hide the others
+            for (service, key), future in futures.items():
+                try:
+                    data[service][key] = future.result()
+                except Exception as e:
+                    data[service]["error"] = str(e)
+                    self.logger.error(f"{SERVICE_NAMES[service]} fetch error: {e}")
         
-        return data
+        return data, timings
     
-    def process_shipstation_orders(self, orders_response: ShipStationOrdersResponse, stores_data: Optional[dict] = None) -> List[Dict]:
-        """Process ShipStation orders for display."""
+    def process_shipstation_orders(self, orders_response: ShipStationOrdersListingResponse, stores_data: Optional[dict] = None) -> Dict[str, List]:
+        """Process ShipStation orders for display as a dict of columns (see ORDER_COLUMNS)."""
         if not orders_response or not orders_response.orders:
-            return []
-        
-        # Store name abbreviation dictionary
-        STORE_ABBREVIATIONS = {
-            'Bala': 'Bala',
-            'Body Nutrition - Wholesale': 'Wholesale',
-            'Gym Molly Store': 'Gym Molly',
-            'MWL Buyside Store': 'MWL',
-            'Manual Orders': 'Manual',
-            'MediWeight OLD Orders': 'MWL OLD',
-            'New Amazon Store': 'Amazon',
-            'Rate Browser': 'Unused',
-            'Shopify Store': 'Shopify',
-            'TestRateShopping': 'TEST'
-        }
+            return _to_columns([], ORDER_COLUMNS)
         
         # Build store ID to name mapping from stores API
-        store_id_to_name = {}
-        if stores_data:
-            for store in stores_data:
-                if isinstance(store, dict):
-                    store_id = store.get('storeId')
-                    store_name = store.get('storeName')
-                    if store_id and store_name:
-                        store_id_to_name[str(store_id)] = store_name
-        
-        processed_orders = []
+        store_id_to_name = build_store_map(stores_data)
         
-        for order in orders_response.orders:
-            try:
-                # Calculate total items
-                total_items = sum(item.quantity or 0 for item in order.items) if order.items else 0
-                
-                # Get store information
-                store_name = "Unknown Store"
-                store_id = None
-                
-                # Check advancedOptions for store ID
-                if order.advancedOptions:
-                    store_id = order.advancedOptions.get('storeId')
-                
-                # Get the store name from our mapping
-                if store_id and str(store_id) in store_id_to_name:
-                    store_name = store_id_to_name[str(store_id)]
-                elif store_id:
-                    store_name = f"Store {store_id}"
-                
-                # Clean up and apply abbreviation
-                store_name = str(store_name).strip()
-                store_name = STORE_ABBREVIATIONS.get(store_name, store_name)
-                
-                # Process weight - convert to oz/lbs display
-                weight_display = "N/A"
-                if order.weight and order.weight.value:
-                    weight_value = order.weight.value
-                    weight_unit = order.weight.units or "LBS"
-                    
-                    # Convert to ounces first if needed
-                    if weight_unit.upper() in ["LBS", "LB", "POUNDS"]:
-                        weight_in_oz = weight_value * 16
-                    elif weight_unit.upper() in ["OZ", "OUNCES"]:
-                        weight_in_oz = weight_value
-                    else:
-                        # Default to showing original value with unit
-                        weight_display = f"{weight_value:.1f} {weight_unit}"
-                        weight_in_oz = None
-                    
-                    # Format based on weight
-                    if weight_in_oz is not None:
-                        if weight_in_oz >= 16:
-                            # Display in pounds
-                            weight_in_lbs = weight_in_oz / 16
-                            weight_display = f"{weight_in_lbs:.1f} lbs"
-                        else:
-                            # Display in ounces
-                            weight_display = f"{weight_in_oz:.1f} oz"
-                
-                # Format order date to MM/DD/YYYY
-                order_date_formatted = order.orderDate
-                if order.orderDate:
-                    try:
-                        # Parse ISO date format
-                        date_obj = datetime.fromisoformat(order.orderDate.replace('Z', '+00:00').split('.')[0])
-                        order_date_formatted = date_obj.strftime("%-m/%-d/%Y")
-                    except:
-                        # Fallback to original if parsing fails
-                        order_date_formatted = order.orderDate
-                
-                # Get shipping info
-                ship_to_company = ""
-                ship_to_city = ""
-                if order.shipTo:
-                    ship_to_company = order.shipTo.company or order.shipTo.name or ""
-                    ship_to_city = order.shipTo.city or ""
-                
-                processed_orders.append({
-                    "Order ID": order.orderNumber,
-                    "Store": store_name,  # Add store column
-                    "Status": order.orderStatus,
-                    "Customer": order.customerEmail or "N/A",
-                    "Ship To": f"{ship_to_company} ({ship_to_city})",
-                    "Items": total_items,
-                    "Order Total": order.orderTotal or 0,
-                    "Weight": weight_display,
-                    "Order Date": order_date_formatted,
-                    "Ship Date": order.shipDate or "Not Shipped",
-                    "Carrier": order.carrierCode or "Not Assigned",
-                    "Service": order.requestedShippingService or "N/A",
-                    "_order_date_raw": order.orderDate  # Keep raw date for age calculation
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Error processing ShipStation order {order.orderId}: {str(e)}")
-                continue
+        # Orders are already validated, so every field has its declared type
+        processed_orders = [_process_order(order, store_id_to_name) for order in orders_response.orders]
         
-        return processed_orders
+        columns = _to_columns(processed_orders, ORDER_COLUMNS)
+        if processed_orders:
+            weight_values, weight_units = zip(*columns["Weight"])
+            columns["Weight"] = _format_weights(weight_values, weight_units)
+        return columns
     
-    def process_shipstation_shipments(self, shipments_response: ShipStationShipmentsResponse) -> List[Dict]:
-        """Process ShipStation shipments for display."""
+    def get_order_totals(self, order_columns: Dict[str, List]) -> Dict:
+        """Pending count and total value of processed orders, in the form get_unified_summary takes."""
+        return {
+            "pending_orders": len(order_columns["Order Total"]),
+            "total_order_value": sum(order_columns["Order Total"])
+        }
+    
+    def process_shipstation_shipments(self, shipments_response: ShipStationShipmentsListingResponse) -> Dict[str, List]:
+        """Process ShipStation shipments for display as a dict of columns (see SHIPMENT_COLUMNS)."""
         if not shipments_response or not shipments_response.shipments:
-            return []
-        
-        processed_shipments = []
+            return _to_columns([], SHIPMENT_COLUMNS)
         
-        for shipment in shipments_response.shipments:
-            try:
-                # Get weight info
-                weight = 0
-                weight_unit = "LBS"
-                if shipment.weight:
-                    weight = shipment.weight.value or 0
-                    weight_unit = shipment.weight.units or "LBS"
-                
-                # Get shipping address
-                ship_to = ""
-                if shipment.shipTo:
-                    company = shipment.shipTo.company or shipment.shipTo.name or ""
-                    city = shipment.shipTo.city or ""
-                    ship_to = f"{company} ({city})"
-                
-                processed_shipments.append({
-                    "Shipment ID": shipment.shipmentId,
-                    "Order Number": shipment.orderNumber,
-                    "Customer": shipment.customerEmail or "N/A",
-                    "Ship To": ship_to,
-                    "Tracking": shipment.trackingNumber or "No Tracking",
-                    "Carrier": shipment.carrierCode or "Unknown",
-                    "Service": shipment.serviceCode or "N/A",
-                    "Weight": weight,
-                    "Weight Unit": weight_unit,
-                    "Cost": shipment.shipmentCost or 0,
-                    "Ship Date": shipment.shipDate,
-                    "Voided": shipment.voided or False
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Error processing ShipStation shipment {shipment.shipmentId}: {str(e)}")
-                continue
+        # Shipments are already validated, so every field has its declared type
+        processed_shipments = [_process_shipment(shipment) for shipment in shipments_response.shipments]
         
-        return processed_shipments
+        return _to_columns(processed_shipments, SHIPMENT_COLUMNS)
     
     def process_airtable_pickups(self, pickups_data: Optional[List]) -> List[Dict]:
         """Process Airtable upcoming pickups for display."""
@@ -353,8 +476,13 @@ class UnifiedDataService:
         
         return self.airtable_service.process_pickup_data(pickups_data)
     
-    def get_unified_summary(self, all_data: Dict) -> Dict:
-        """Calculate unified summary metrics."""
+    def get_unified_summary(self, all_data: Dict, order_totals: Optional[Dict] = None,
+                            fv_inbound: Optional[List[Dict]] = None, fv_outbound: Optional[List[Dict]] = None) -> Dict:
+        """Calculate unified summary metrics.
+        
+        order_totals (see get_order_totals) and the processed FreightView rows can be
+        passed when they are already at hand; otherwise they are worked out here.
+        """
         summary = {
             "freightview": {
                 "total_shipments": 0,
@@ -382,12 +510,16 @@ class UnifiedDataService:
         
         # Process FreightView data
         if all_data["freightview"]["shipments"] and not all_data["freightview"]["error"]:
-            fv_inbound = self.freight_service.process_inbound_data(all_data["freightview"]["shipments"])
-            fv_outbound = self.freight_service.process_outbound_data(all_data["freightview"]["shipments"])
+            if fv_inbound is None or fv_outbound is None:
+                fv_inbound = self.freight_service.process_inbound_data(all_data["freightview"]["shipments"])
+                fv_outbound = self.freight_service.process_outbound_data(all_data["freightview"]["shipments"])
             fv_metrics = self.freight_service.get_summary_metrics(fv_inbound, fv_outbound)
             
+            # Direction counts are the processed row counts, so they match the table sizes
             summary["freightview"] = {
                 "total_shipments": fv_metrics["total_shipments"],
+                "inbound_count": fv_metrics["inbound_count"],
+                "outbound_count": fv_metrics["outbound_count"],
                 "total_cost": fv_metrics["total_cost"],
                 "avg_cost_per_lb": fv_metrics["avg_cost_per_lb"],
                 "status": "connected"
@@ -395,12 +527,18 @@ class UnifiedDataService:
         
         # Process ShipStation data
         if all_data["shipstation"]["orders"] and not all_data["shipstation"]["error"]:
-            ss_orders = self.process_shipstation_orders(all_data["shipstation"]["orders"], all_data["shipstation"]["stores"])
-            ss_shipped = self.process_shipstation_shipments(all_data["shipstation"]["shipments"]) if all_data["shipstation"]["shipments"] else []
+            if order_totals is None:
+                # Count and total straight from the response without processing the orders
+                orders = all_data["shipstation"]["orders"].orders
+                order_totals = {
+                    "pending_orders": len(orders),
+                    "total_order_value": sum(order.orderTotal or 0 for order in orders)
+                }
+            ss_shipped = all_data["shipstation"]["shipments"]
             
-            pending_orders = len(ss_orders)
-            shipped_orders = len(ss_shipped)
-            total_order_value = sum(order.get("Order Total", 0) for order in ss_orders)
+            pending_orders = order_totals["pending_orders"]
+            shipped_orders = len(ss_shipped.shipments) if ss_shipped else 0
+            total_order_value = order_totals["total_order_value"]
             avg_order_value = total_order_value / pending_orders if pending_orders > 0 else 0
             
             summary["shipstation"] = {